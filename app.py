@@ -11,23 +11,45 @@ Features:
 - Enhanced UI with balanced layout
 """
 
+import html
+import io
 import os
-import time
+import re
+from time import time as _time
+import hashlib
+from pathlib import Path
 import random
-import threading
+import asyncio
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
-from datetime import datetime
+from datetime import datetime as _dt
 from dotenv import load_dotenv
 import json
 
+# orjson (de)serializes JSON several times faster than the stdlib; fall
+# back quietly
+try:
+    import orjson
+    def _loads(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj):
+        # default=asdict mirrors orjson's native dataclass support
+        return json.dumps(obj, default=asdict).encode()
+
 # OpenAI imports with better error handling
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     st.error("OpenAI library not installed. Run: pip install openai")
-
 # Load environment variables
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -44,143 +66,442 @@ def init_openai_client():
         return None
     
     try:
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        # Test the connection
-        client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": "test"}],
-            max_tokens=1
-        )
-        return client
+        # Constructing the client does not open a connection; a bad key or
+        # network problem surfaces on the first real call with the same
+        # error handling, so no warm-up request is needed here. The SDK
+        # handles 429/5xx retries itself with exponential backoff + jitter.
+        return OpenAI(api_key=OPENAI_API_KEY, max_retries=3, timeout=30)
     except Exception as e:
         st.error(f"❌ Failed to initialize OpenAI client: {str(e)}")
         return None
 
 client = init_openai_client()
 
+@st.cache_resource
+def init_async_openai_client():
+    """Initialize the async OpenAI client used for concurrent scoring"""
+    if not OPENAI_API_KEY or not OPENAI_AVAILABLE:
+        return None
+    return AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=3, timeout=30)
+
+@st.cache_resource
+def _scoring_pool():
+    """Shared thread pool for background answer scoring"""
+    return ThreadPoolExecutor(max_workers=4)
+
 # Enhanced question categories
 QUESTION_CATEGORIES = {
-    "General": [
+    "General": (
         "Tell me about yourself.",
         "Why are you interested in this position?",
         "What are your strengths and weaknesses?",
         "Where do you see yourself in 5 years?",
         "Why should we hire you?",
         "Describe a challenging situation you faced and how you handled it.",
-    ],
-    "Technical": [
+    ),
+    "Technical": (
         "Explain object-oriented programming principles.",
         "What is the difference between SQL and NoSQL databases?",
         "Describe your experience with version control systems.",
         "How do you ensure code quality and maintainability?",
         "Explain the concept of API design and RESTful services.",
         "What are design patterns and can you give examples?",
-    ],
-    "Behavioral": [
+    ),
+    "Behavioral": (
         "Tell me about a time you had to work with a difficult team member.",
         "Describe a project where you had to meet a tight deadline.",
         "Give an example of when you had to learn something new quickly.",
         "Tell me about a mistake you made and how you handled it.",
         "Describe a time when you had to explain something complex to a non-technical person.",
-    ],
-    "Problem Solving": [
+    ),
+    "Problem Solving": (
         "How would you approach debugging a system that's running slowly?",
         "Design a system for a library management system.",
         "How would you handle a situation where a client is unhappy with deliverables?",
         "Explain how you would prioritize tasks when everything seems urgent.",
         "Walk me through your problem-solving process.",
-    ]
+    )
 }
 
 DIFFICULTY_LEVELS = {
-    "Beginner": {"time_multiplier": 1.5, "complexity": "basic"},
-    "Intermediate": {"time_multiplier": 1.0, "complexity": "moderate"},
-    "Advanced": {"time_multiplier": 0.8, "complexity": "complex"}
+    "Beginner": {"time_multiplier": 1.5, "complexity": "basic", "complexity_label": "entry-level"},
+    "Intermediate": {"time_multiplier": 1.0, "complexity": "moderate", "complexity_label": "mid-level professional"},
+    "Advanced": {"time_multiplier": 0.8, "complexity": "complex", "complexity_label": "senior-level expert"}
 }
 
-def ask_chat(prompt, model="gpt-4o-mini", max_retries=3):
-    """Enhanced chat function with retry logic and better error handling"""
+def ask_chat(prompt, model="gpt-4o-mini", max_tokens=512,
+             temperature=0.7, response_format=None):
+    """Enhanced chat function with better error handling.
+
+    Retries are delegated to the OpenAI client, which only backs off
+    (exponentially, with jitter) when the server actually signals it —
+    unlike the old flat one-second sleep loop. Callers should pass a
+    max_tokens bound sized to the expected output; generation latency
+    and cost scale with the cap.
+    """
     if not client:
         return "❌ OpenAI client not available. Please check your API key and connection."
-    
-    for attempt in range(max_retries):
-        try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=1500
-            )
-            return response.choices[0].message.content.strip()
-        
-        except Exception as e:
-            if attempt == max_retries - 1:
-                return f"❌ Error after {max_retries} attempts: {str(e)}"
-            time.sleep(1)  # Brief delay before retry
-
-def extract_name(answer_text):
-    """Enhanced name extraction with validation"""
-    if not answer_text.strip():
-        return "Candidate"
-    
-    prompt = f"""
-    Extract ONLY the first name from this introduction. Rules:
-    - Return only the first name (no last names, titles, or extra words)
-    - If no clear first name is found, return "Candidate"
-    - If multiple names, return only the first one
-    
-    Introduction: "{answer_text[:200]}"
+
+    extra_kwargs = {"response_format": response_format} if response_format else {}
+    messages = [{"role": "user", "content": prompt}]
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **extra_kwargs
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        return f"❌ Error: {str(e)}"
+
+# Cross-session response cache, keyed by SHA-256 of (model, prompt)
+_LLM_CACHE_DIR = Path(".cache/llm")
+
+def _disk_cache_get(key):
+    """Read a cached response from disk, or None"""
+    try:
+        return _loads((_LLM_CACHE_DIR / f"{key}.json").read_bytes())["response"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _disk_cache_set(key, prompt, response, model):
+    """Persist a response to disk; cache failures are never fatal"""
+    try:
+        _LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_LLM_CACHE_DIR / f"{key}.json").write_bytes(_dumps({
+            "prompt": prompt, "response": response, "model": model, "ts": _time()
+        }))
+    except OSError:
+        pass
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def ask_chat_cached(prompt, model="gpt-4o-mini", max_tokens=512, temperature=0.7,
+                    response_format=None):
+    """Memoized ask_chat for prompts that repeat across reruns and sessions.
+
+    Two tiers: st.cache_data for the in-process hot path, plus a disk
+    cache that survives restarts and is shared across sessions. A hit on
+    either skips the OpenAI round-trip entirely, which matters for
+    calculate_score: the question bank is static, so identical scoring
+    prompts recur across reruns and sessions. (The feedback and
+    practice-material paths share the disk tier directly, keyed the
+    same way.)
+    Error responses raise instead of returning: st.cache_data memoizes
+    return values but not exceptions, so a transient failure never gets
+    pinned to its (prompt, model) key in either tier and the next call
+    retries for real. Callers catch and produce their fallbacks.
     """
-    
+    key = hashlib.sha256(f"{model}\n{prompt}".encode()).hexdigest()
+    cached = _disk_cache_get(key)
+    if cached is not None:
+        return cached
+
+    response = ask_chat(prompt, model, max_tokens=max_tokens,
+                        temperature=temperature, response_format=response_format)
+    if response.startswith("❌"):
+        raise RuntimeError(response)
+    _disk_cache_set(key, prompt, response, model)
+    return response
+
+def ask_chat_stream(prompt, model="gpt-4o-mini", max_tokens=1500):
+    """Stream a chat response chunk by chunk for incremental rendering.
+
+    Use with st.write_stream so the user sees tokens as they arrive
+    instead of waiting for the full completion. Keep the blocking
+    ask_chat for callers that need the whole response (e.g. JSON).
+    """
+    if not client:
+        yield "❌ OpenAI client not available. Please check your API key and connection."
+        return
+
+    messages = [{"role": "user", "content": prompt}]
     try:
-        name = ask_chat(prompt, max_retries=2)
-        if name and len(name.split()) <= 2:  # Reasonable name length
-            clean_name = ''.join(c for c in name.split()[0] if c.isalpha() or c == '-')
-            return clean_name.title() if clean_name else "Candidate"
-        return "Candidate"
-    except:
-        return "Candidate"
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        for chunk in stream:
+            yield chunk.choices[0].delta.content or ""
+    except Exception as e:
+        yield f"❌ Error: {str(e)}"
+
+# Matches the usual self-introduction phrasings ("Hi, I'm Alice", "My name
+# is Bob", ...) so the common case never needs a model call
+# names must be capitalized so phrases like "I am passionate" don't match
+_NAME_RE = re.compile(
+    r"(?i:my name is|i['’]m|i am|this is|call me)\s+([A-Z][a-z'’\-]{1,30})"
+)
+
+def _clean_name(raw_name):
+    """Validate and normalize a model-provided first name"""
+    if raw_name and len(raw_name.split()) <= 2:  # Reasonable name length
+        clean_name = ''.join(c for c in raw_name.split()[0] if c.isalpha() or c == '-')
+        return clean_name.title() if clean_name else "Candidate"
+    return "Candidate"
+
+def _scoring_prompt(answer, question, difficulty):
+    """Build the shared scoring prompt used by sync and async scorers"""
+    return f"""
+    As an expert interview coach, evaluate this {DIFFICULTY_LEVELS[difficulty]["complexity_label"]} candidate's answer.
+
+    Question: {question}
+    Answer: {answer}
+
+    Provide a JSON response with:
+    {{
+        "score": [0-10 integer],
+        "strengths": ["strength1", "strength2"],
+        "improvements": ["improvement1", "improvement2"],
+        "sample_answer": "brief improved version"
+    }}
+
+    Scoring criteria:
+    - Relevance and completeness (40%)
+    - Clarity and structure (30%)
+    - Specific examples and details (30%)
+    """
 
 def calculate_score(answer, question, difficulty="Intermediate"):
     """Calculate comprehensive score for an answer"""
     if not answer.strip():
         return {"score": 0, "feedback": "No answer provided"}
-    
-    complexity_map = {
-        "Beginner": "entry-level",
-        "Intermediate": "mid-level professional", 
-        "Advanced": "senior-level expert"
-    }
-    
+
+    try:
+        # JSON mode guarantees a parseable object — no fence/prose sniffing
+        response = ask_chat_cached(_scoring_prompt(answer, question, difficulty),
+                                   max_tokens=400, temperature=0.2,
+                                   response_format={"type": "json_object"})
+        return _loads(response)
+    except:
+        return {"score": 5, "feedback": "Unable to analyze answer at this time"}
+
+async def _ascore(async_client, semaphore, answer, question, difficulty):
+    """Score one answer through the async client, rate-limited by semaphore"""
+    async with semaphore:
+        try:
+            response = await async_client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": _scoring_prompt(answer, question, difficulty)}],
+                temperature=0.2,
+                max_tokens=400,
+                response_format={"type": "json_object"}
+            )
+            return _loads(response.choices[0].message.content.strip())
+        except Exception:
+            return {"score": 5, "feedback": "Unable to analyze answer at this time"}
+
+async def _afeedback(async_client, prompt):
+    """Generate the batched feedback report through the async client"""
+    try:
+        response = await async_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=1500,
+            response_format={"type": "json_object"}
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        return f"❌ Error: {str(e)}"
+
+def finalize_results(pending, feedback_prompt=None):
+    """Run leftover scorings and the feedback call in one event loop.
+
+    The feedback prompt only needs questions, answers and timings — not
+    the evaluations — so it is independent of the scoring backfill and
+    the whole batch costs roughly max(latency) instead of sum(latency).
+    Fires every request in one asyncio.gather; the semaphore keeps the
+    scorings under rate limits. The feedback call keeps the same disk
+    tier ask_chat_cached uses, so replaying an identical report (e.g.
+    after New Interview wiped session state) skips the 1500-token
+    completion. Takes a list of (q_index, answer_record) pairs plus an
+    optional feedback prompt and returns
+    ({q_index: evaluation}, raw_feedback_or_None).
+    """
+    feedback_key = raw_feedback = None
+    if feedback_prompt is not None:
+        feedback_key = hashlib.sha256(f"gpt-4o-mini\n{feedback_prompt}".encode()).hexdigest()
+        raw_feedback = _disk_cache_get(feedback_key)
+    need_feedback = feedback_prompt is not None and raw_feedback is None
+    if not pending and not need_feedback:
+        return {}, raw_feedback
+
+    async_client = init_async_openai_client()
+    if not async_client:
+        if need_feedback:
+            raw_feedback = "❌ OpenAI client not available. Please check your API key and connection."
+        return {}, raw_feedback
+
+    async def _finalize():
+        semaphore = asyncio.Semaphore(5)
+        tasks = [
+            _ascore(async_client, semaphore, record['answer'],
+                    record['question'], record.get('difficulty', 'Intermediate'))
+            for _, record in pending
+        ]
+        if need_feedback:
+            tasks.append(_afeedback(async_client, feedback_prompt))
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(_finalize())
+    if need_feedback:
+        raw_feedback = results.pop()
+        if not raw_feedback.startswith("❌"):
+            _disk_cache_set(feedback_key, feedback_prompt, raw_feedback, "gpt-4o-mini")
+    evaluations = {q_idx: evaluation for (q_idx, _), evaluation in zip(pending, results)}
+    return evaluations, raw_feedback
+
+def evaluate_first_answer(answer, question, difficulty="Intermediate"):
+    """Extract the candidate's name and score the first answer in one call.
+
+    The introduction used to cost two serial OpenAI round-trips (name
+    extraction, then scoring); a single prompt returns both.
+    """
+    if not answer.strip():
+        return {"first_name": "Candidate", "score": 0, "feedback": "No answer provided"}
+
+    # Prefer the locally-extracted name; the model's answer only fills in
+    # when the regex misses
+    match = _NAME_RE.search(answer[:200])
+    fast_name = _clean_name(match.group(1)) if match else None
+
     prompt = f"""
-    As an expert interview coach, evaluate this {complexity_map[difficulty]} candidate's answer.
-    
+    As an expert interview coach, evaluate this {DIFFICULTY_LEVELS[difficulty]["complexity_label"]} candidate's self-introduction.
+
     Question: {question}
     Answer: {answer}
-    
+
     Provide a JSON response with:
     {{
+        "first_name": "[candidate's first name, or Candidate if none given]",
         "score": [0-10 integer],
         "strengths": ["strength1", "strength2"],
         "improvements": ["improvement1", "improvement2"],
         "sample_answer": "brief improved version"
     }}
-    
+
     Scoring criteria:
     - Relevance and completeness (40%)
     - Clarity and structure (30%)
     - Specific examples and details (30%)
     """
-    
+
     try:
-        response = ask_chat(prompt)
-        # Try to parse JSON, fallback to text if needed
-        if response.startswith('{'):
-            return json.loads(response)
-        else:
-            return {"score": 5, "feedback": response}
+        response = ask_chat(prompt, max_tokens=400, temperature=0.2,
+                            response_format={"type": "json_object"})
+        result = _loads(response)
+        result["first_name"] = fast_name or _clean_name(result.get("first_name", ""))
+        return result
     except:
-        return {"score": 5, "feedback": "Unable to analyze answer at this time"}
+        pass
+    return {"first_name": fast_name or "Candidate", "score": 5,
+            "feedback": "Unable to analyze answer at this time"}
+
+def queue_scoring(q_index, answer, question):
+    """Score an answer on a background thread so the UI can advance immediately.
+
+    The Future is kept in session state and resolved when the summary or
+    analytics screen needs the results. Question 0 goes through
+    evaluate_first_answer so the candidate's name rides along.
+    """
+    if not answer.strip():
+        return
+
+    difficulty = st.session_state.difficulty
+    if q_index == 0:
+        future = _scoring_pool().submit(evaluate_first_answer, answer, question, difficulty)
+    else:
+        future = _scoring_pool().submit(calculate_score, answer, question, difficulty)
+    st.session_state.score_futures[q_index] = future
+
+@dataclass(slots=True)
+class AnswerRecord:
+    """One slim per-answer record; interview-wide context lives elsewhere.
+
+    Slotted attribute access beats per-key dict hashing in the summary
+    loops, and without a __dict__ each record costs less memory. orjson
+    serializes dataclasses natively, so the blob format is unchanged.
+    """
+    q_idx: int
+    answer: str = ""
+    time_taken: int = 0
+    answered: bool = False
+    evaluation: dict = None
+
+def _load_answers():
+    """Deserialize the answer records from their compact session blob.
+
+    The records live in session state as one orjson-encoded bytes value
+    instead of a list of Python dicts, so Streamlit's per-rerun state
+    handling touches a single object rather than walking N dicts.
+    """
+    return [AnswerRecord(**d) for d in _loads(st.session_state.get("answers_blob", b"[]"))]
+
+def _save_answers(records):
+    """Serialize the answer records back into the session blob"""
+    st.session_state.answers_blob = _dumps(records)
+
+def _append_answer(record):
+    """Append one answer record to the session blob.
+
+    Every record is guaranteed to carry q_idx, answer ('' when skipped)
+    and time_taken (0 when unknown), so readers index them directly
+    instead of going through .get() defaults. Answered-ness is flagged
+    once here so the summary paths can sum plain ints instead of
+    re-stripping every answer string per rerun.
+    """
+    record.answer = record.answer or ""
+    record.time_taken = record.time_taken or 0
+    record.answered = bool(record.answer.strip())
+    records = _load_answers()
+    records.append(record)
+    _save_answers(records)
+
+def collect_scores(timeout=30):
+    """Resolve pending background scorings into the answer records"""
+    if not st.session_state.score_futures:
+        return
+
+    records = _load_answers()
+    changed = False
+    for q_idx, future in list(st.session_state.score_futures.items()):
+        if timeout == 0 and not future.done():
+            continue
+        try:
+            evaluation = future.result(timeout=timeout)
+        except Exception:
+            evaluation = {"score": 5, "feedback": "Unable to analyze answer at this time"}
+
+        if q_idx == 0 and not st.session_state.candidate_name:
+            st.session_state.candidate_name = evaluation.pop("first_name", "Candidate")
+        if q_idx < len(records):
+            records[q_idx].evaluation = evaluation
+            changed = True
+        del st.session_state.score_futures[q_idx]
+
+    if changed:
+        _save_answers(records)
+
+def get_answer_view(i, records=None):
+    """Join a slim answer record with interview-wide context.
+
+    Answer records hold only the fields that vary per answer; the
+    question text lives in st.session_state.questions and the category/
+    difficulty apply to the whole interview, so none of that is
+    duplicated N times in session state. Pass pre-loaded records when
+    iterating so the blob is deserialized once.
+    """
+    record = (records if records is not None else _load_answers())[i]
+    view = asdict(record)
+    view["question"] = st.session_state.questions[record.q_idx]
+    view["category"] = st.session_state.category
+    view["difficulty"] = st.session_state.difficulty
+    return view
 
 def format_time(seconds):
     """Format time in MM:SS format"""
@@ -188,6 +509,264 @@ def format_time(seconds):
     seconds = seconds % 60
     return f"{minutes:02d}:{seconds:02d}"
 
+def _clip(text, limit=500):
+    """Truncate long text with an ellipsis; short text passes through untouched"""
+    return text if len(text) <= limit else text[:limit] + "…"
+
+_FEEDBACK_SCHEMA = (
+    'Return a JSON object with exactly these keys:\n'
+    '{"overall_score": [0-100 integer], '
+    '"strengths": ["3-4 key strengths observed"], '
+    '"improvements": ["3-4 specific areas to work on"], '
+    '"per_question": [{"idx": [item number], "feedback": "1-2 sentences on that answer"}], '
+    '"recommendations": ["specific actionable advice for improvement"], '
+    '"readiness": "overall readiness level and what to focus on"}'
+)
+
+def build_feedback_prompt(answer_views, answered_count, total_time):
+    """Build the single batched feedback request.
+
+    The rubric and candidate context appear once, the Q/A pairs are
+    enumerated beneath, and the model answers with one JSON object
+    covering every question plus the overall summary — one round-trip
+    and no rubric repeated per item.
+    """
+    header = f"""
+    As an expert interview coach, analyze this {st.session_state.difficulty}-level {st.session_state.category} interview performance.
+
+    Candidate: {st.session_state.candidate_name or 'Anonymous'}
+    Difficulty: {st.session_state.difficulty}
+    Category: {st.session_state.category}
+
+    Interview Performance Summary:
+    - Total Questions: {len(answer_views)}
+    - Questions Answered: {answered_count}
+    - Total Time: {format_time(total_time)}
+    - Completion Rate: {(answered_count / len(answer_views)) * 100:.1f}%
+
+    Questions and Answers:
+    """
+
+    items = "\n".join([
+        f"{idx}. Q: {ans['question']}\n"
+        f"   A: {_clip(ans['answer']) or '[No answer provided]'}\n"
+        f"   Time Used: {ans['time_taken']}s / {st.session_state.time_limit}s"
+        for idx, ans in enumerate(answer_views, 1)
+    ])
+
+    return f"{header}\n{items}\n\n{_FEEDBACK_SCHEMA}"
+
+def feedback_to_markdown(feedback):
+    """Render structured feedback as the markdown report shown in-app"""
+    if not isinstance(feedback, dict):
+        return str(feedback)
+
+    lines = [f"### Overall Performance Score: {feedback.get('overall_score', 'N/A')}/100", ""]
+    lines.append("**Strengths Demonstrated:**")
+    lines += [f"- {s}" for s in feedback.get("strengths", [])]
+    lines.append("")
+    lines.append("**Areas for Improvement:**")
+    lines += [f"- {s}" for s in feedback.get("improvements", [])]
+    lines.append("")
+    lines.append("**Question-by-Question Analysis:**")
+    lines += [f"- **Q{item.get('idx', i + 1)}:** {item.get('feedback', '')}"
+              for i, item in enumerate(feedback.get("per_question", []))]
+    lines.append("")
+    lines.append("**Recommendations for Next Steps:**")
+    lines += [f"- {s}" for s in feedback.get("recommendations", [])]
+    lines.append("")
+    lines.append(f"**Interview Readiness:** {feedback.get('readiness', '')}")
+    return "\n".join(lines)
+
+def render_timer():
+    """Live countdown for the current question.
+
+    Wrapped in st.fragment(run_every="1s") at the call site so only this
+    function re-executes each tick — the CSS, sidebar, and question card
+    render once per user action instead of once per second. Question
+    advancement on timeout escalates to a full-app rerun.
+    """
+    q_index = st.session_state.current_q
+    if (q_index is None or q_index >= len(st.session_state.questions)
+            or not st.session_state.start_time or st.session_state.paused):
+        return
+
+    elapsed = int(_time() - st.session_state.start_time)
+    remaining = max(0, st.session_state.time_limit - elapsed)
+
+    if remaining > 30:
+        timer_class = "timer-normal"
+        timer_emoji = "🟢"
+    elif remaining > 10:
+        timer_class = "timer-warning"
+        timer_emoji = "🟡"
+    else:
+        timer_class = "timer-danger"
+        timer_emoji = "🔴"
+
+    st.markdown(f'''
+    <div class="timer-container {timer_class} fade-in-up">
+        <div style="font-size: 1.5rem; font-weight: bold;">
+            {timer_emoji} Time Remaining: {format_time(remaining)}
+        </div>
+    </div>
+    ''', unsafe_allow_html=True)
+
+    # Auto-advance when time runs out
+    if remaining == 0:
+        st.warning("⏰ Time's up! Moving to next question...")
+
+        current_question = st.session_state.questions[q_index]
+        current_answer = st.session_state.get(f"answer_{q_index}_{st.session_state.difficulty}", "")
+
+        _append_answer(AnswerRecord(
+            q_idx=q_index,
+            answer=current_answer,
+            time_taken=st.session_state.time_limit
+        ))
+
+        # Score in the background; the next question renders immediately
+        queue_scoring(q_index, current_answer, current_question)
+
+        st.session_state.current_q += 1
+        st.session_state.start_time = _time()
+        st.rerun(scope="app")
+
+_METRIC_TMPL = ('<div class="metric-card fade-in-up">'
+                '<div class="metric-value">{v}</div>'
+                '<div class="metric-label">{l}</div>'
+                '</div>')
+
+@st.cache_data(show_spinner=False)
+def metrics_html(metrics):
+    """Render (value, label) metric cards as one HTML grid.
+
+    The old layout emitted four separate st.markdown widgets inside
+    st.columns; a single cached blob on a CSS grid keeps the widget tree
+    at one element and skips the f-string work on reruns.
+    """
+    cards = "".join(_METRIC_TMPL.format_map({"v": v, "l": l}) for v, l in metrics)
+    return f'<div class="metric-grid">{cards}</div>'
+
+# Timing feedback buckets, indexed by the quantized time ratio instead of
+# an if/elif ladder per answer. Index = ceil(time_taken / time_limit * 10)
+# clamped to 11, so the old ≤50% / ≤80% / ≤100% bracket edges hold exactly.
+_TIMING_BADGES = (
+    (("timing-success", "⚡ Quick Response - Great timing!"),) * 6
+    + (("timing-info", "✅ Good Timing - Well paced"),) * 3
+    + (("timing-warning", "⏱️ Close Call - Used most of the time"),) * 2
+    + (("timing-danger", "⏰ Over Time - Consider being more concise"),)
+)
+
+_TIMING_ALERTS = (
+    ((st.success, "⚡ Quick response"),) * 6
+    + ((st.info, "⏱️ Good timing"),) * 5
+    + ((st.warning, "🐌 Over time limit"),)
+)
+
+def _timing_idx(time_taken, time_limit):
+    """Quantize the time ratio to a bucket index (integer ceiling division,
+    no float math, no branches)"""
+    return min(-(-time_taken * 10 // time_limit), 11)
+
+@st.cache_data(show_spinner=False)
+def render_result_row(answer_data, time_limit):
+    """Render one result row as a single HTML blob.
+
+    The old loop emitted five or six widgets per question (markdown,
+    write, status boxes); one markdown element per expander keeps the
+    widget tree small and the rendered HTML is cached per answer.
+    """
+    answer = answer_data['answer'].strip()
+    if answer:
+        answer_html = html.escape(answer).replace('\n', '<br>')
+        body = f"<p><strong>Your Answer:</strong></p><p>{answer_html}</p>"
+    else:
+        body = "<p><em>No answer provided</em></p>"
+
+    evaluation = answer_data.get('evaluation')
+    score_html = ""
+    if evaluation and 'score' in evaluation:
+        score_html = f"<p><strong>AI Score:</strong> {evaluation['score']}/10</p>"
+
+    time_taken = answer_data['time_taken']
+    badge_class, badge_msg = _TIMING_BADGES[_timing_idx(time_taken, time_limit)]
+
+    return (f"{body}{score_html}"
+            f"<p><strong>Time Taken:</strong> {time_taken}s</p>"
+            f'<div class="timing-badge {badge_class}">{badge_msg}</div>')
+
+@st.cache_data(show_spinner=False)
+def build_report(answers_blob, questions, candidate, category, difficulty,
+                 feedback_md, time_limit):
+    """Build the downloadable report and share summary once per result set.
+
+    Keyed on the serialized answers and the feedback text, so toggling
+    expanders or other reruns of the results screen reuse the cached
+    strings instead of re-formatting the whole report. The date stamp is
+    frozen with the cache entry — it reflects when the report was built.
+    """
+    answers = _loads(answers_blob)
+    total_q = len(answers)
+    total_time = sum(a['time_taken'] for a in answers)
+    answered_count = sum(a['answered'] for a in answers)
+    completion_pct = answered_count * 100.0 / total_q
+
+    # Accumulate through StringIO: concatenation happens at the C level
+    # instead of reallocating a growing str every iteration
+    buf = io.StringIO()
+    buf.write(f"""
+AI MOCK INTERVIEW RESULTS
+========================
+Date: {_dt.now().strftime('%Y-%m-%d %H:%M:%S')}
+Candidate: {candidate or 'Anonymous'}
+Category: {category}
+Difficulty: {difficulty}
+Total Questions: {total_q}
+Questions Answered: {answered_count}
+Completion Rate: {completion_pct:.0f}%
+Total Time: {format_time(total_time)}
+
+QUESTIONS & ANSWERS
+==================
+""")
+
+    for i, ans in enumerate(answers, 1):
+        buf.write(f"""
+Q{i}: {questions[ans['q_idx']]}
+Time Allocated: {time_limit}s
+Time Used: {ans['time_taken']}s
+
+Your Answer:
+{ans['answer'] or '[No answer provided]'}
+
+{'='*50}
+""")
+
+    buf.write(f"""
+
+AI COACH FEEDBACK
+================
+{feedback_md}
+
+END OF REPORT
+=============
+Generated by AI Mock Interview Bot
+""")
+    results_text = buf.getvalue()
+
+    summary_text = f"""
+🎯 INTERVIEW SUMMARY
+Completed {answered_count}/{total_q} questions
+Category: {category} ({difficulty})
+Time: {format_time(total_time)}
+Completion: {completion_pct:.0f}%
+
+Ready for your next challenge! 🚀
+"""
+
+    return results_text, summary_text
+
 # Streamlit Configuration
 st.set_page_config(
     page_title="AI Mock Interview Bot",
@@ -196,8 +775,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Enhanced Mobile-Responsive CSS with improved styling
-st.markdown("""
+# Enhanced Mobile-Responsive CSS with improved styling.
+# Built once at import time; every rerun re-emits the same constant so
+# Streamlit's element diffing sees an unchanged node instead of a freshly
+# assembled multi-KB literal.
+_CSS = """
 <style>
 /* Base mobile-first responsive design */
 .main-header {
@@ -473,6 +1055,18 @@ st.markdown("""
     font-weight: 600;
 }
 
+.metric-grid {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    gap: 0 1rem;
+}
+
+@media (max-width: 480px) {
+    .metric-grid {
+        grid-template-columns: 1fr;
+    }
+}
+
 /* Auto-refresh indicator */
 .refresh-indicator {
     position: fixed;
@@ -598,6 +1192,39 @@ st.markdown("""
     }
 }
 
+/* Timing badges inside the result expanders */
+.timing-badge {
+    border-radius: 10px;
+    border-left: 5px solid;
+    padding: 0.75rem 1rem;
+    font-weight: 500;
+    margin-top: 0.5rem;
+}
+
+.timing-success {
+    background: #dcfce7;
+    border-color: #22c55e;
+    color: #166534;
+}
+
+.timing-info {
+    background: #dbeafe;
+    border-color: #3b82f6;
+    color: #1e40af;
+}
+
+.timing-warning {
+    background: #fef3c7;
+    border-color: #f59e0b;
+    color: #92400e;
+}
+
+.timing-danger {
+    background: #fee2e2;
+    border-color: #ef4444;
+    color: #dc2626;
+}
+
 /* Footer styles */
 .footer {
     text-align: center;
@@ -638,15 +1265,29 @@ st.markdown("""
     font-weight: 500;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# Header
-st.markdown('''
+_HEADER_HTML = '''
 <div class="main-header fade-in-up">
     <h1>🎯 AI Mock Interview Bot</h1>
     <p>Practice interviews with AI-powered feedback and real-time scoring</p>
 </div>
-''', unsafe_allow_html=True)
+'''
+
+_FOOTER_HTML = '''
+<div class="footer fade-in-up">
+    <h4>🚀 AI Mock Interview Bot</h4>
+    <p><strong>Practice makes perfect!</strong></p>
+    <p>💡 <em>Pro Tip: Regular practice with different difficulty levels will boost your confidence</em></p>
+    <p>📱 <em>Optimized for mobile - practice anywhere, anytime!</em></p>
+    <p>🎯 <em>Enhanced with perfect alignment and beautiful animations!</em></p>
+</div>
+'''
+
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Header
+st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # Initialize session state
 def init_session_state():
@@ -655,7 +1296,7 @@ def init_session_state():
         "candidate_name": None,
         "current_q": None,
         "questions": [],
-        "answers": [],
+        "answers_blob": b"[]",
         "time_limit": 90,
         "start_time": None,
         "num_questions": 5,
@@ -663,6 +1304,7 @@ def init_session_state():
         "category": "General",
         "difficulty": "Intermediate",
         "interview_stats": {},
+        "score_futures": {},
         "paused": False,
         "auto_refresh": True
     }
@@ -673,66 +1315,68 @@ def init_session_state():
 
 init_session_state()
 
-# Auto-refresh mechanism for timer
-if (st.session_state.current_q is not None and 
-    st.session_state.current_q < len(st.session_state.questions) and
-    st.session_state.start_time and 
-    not st.session_state.paused and
-    st.session_state.auto_refresh):
-    
-    # Add refresh indicator
-    st.markdown('<div class="refresh-indicator">🔄 Live Timer</div>', unsafe_allow_html=True)
-    
-    # Auto-refresh every second during active interview
-    time.sleep(1)
-    st.rerun()
-
 # Sidebar Configuration
-with st.sidebar:
-    st.header("🔧 Configuration")
-    
-    # Mode Selection
-    mode = st.radio(
-        "Choose Mode",
-        ["Start Mock Interview", "Practice Questions & Answers", "Interview Analytics"],
-        index=0
-    )
-    st.session_state.mode = mode
-    
-    if mode == "Start Mock Interview":
-        st.subheader("Interview Settings")
-        
-        # Mobile-optimized layout
-        st.session_state.num_questions = st.selectbox(
-            "Number of Questions", [3, 5, 7, 10], index=1
-        )
-        
-        st.session_state.time_limit = st.selectbox(
-            "Time per Question (seconds)", [60, 90, 120, 180], index=1
-        )
-        
-        st.session_state.category = st.selectbox(
-            "Interview Category", list(QUESTION_CATEGORIES.keys())
-        )
-        
-        st.session_state.difficulty = st.selectbox(
-            "Difficulty Level", list(DIFFICULTY_LEVELS.keys()), index=1
+@st.fragment
+def render_sidebar():
+    """Sidebar configuration, isolated as a fragment.
+
+    Interacting with sidebar widgets re-runs only this function, and the
+    timer fragment's ticks never touch it. Changes the main area must
+    reflect (mode switch, interview settings) escalate to a full rerun.
+    """
+    with st.sidebar:
+        st.header("🔧 Configuration")
+
+        # Mode Selection
+        mode = st.radio(
+            "Choose Mode",
+            ["Start Mock Interview", "Practice Questions & Answers", "Interview Analytics"],
+            index=0
         )
-        
-        # Timer control
-        st.session_state.auto_refresh = st.checkbox("Live Timer Updates", value=True)
-    
-    # AI Query Section
-    st.markdown("---")
-    st.subheader("🤖 Ask AI Coach")
-    user_query = st.text_input("Quick question:", placeholder="How to answer behavioral questions?")
-    
-    if user_query and st.button("Ask", type="secondary"):
-        with st.spinner("🤔 Thinking..."):
-            answer = ask_chat(f"As an interview coach, answer this question concisely: {user_query}")
-        
-        with st.expander("💡 AI Answer", expanded=True):
-            st.write(answer)
+        settings_changed = mode != st.session_state.mode
+        st.session_state.mode = mode
+
+        if mode == "Start Mock Interview":
+            st.subheader("Interview Settings")
+
+            # Mobile-optimized layout
+            new_settings = {
+                "num_questions": st.selectbox(
+                    "Number of Questions", [3, 5, 7, 10], index=1
+                ),
+                "time_limit": st.selectbox(
+                    "Time per Question (seconds)", [60, 90, 120, 180], index=1
+                ),
+                "category": st.selectbox(
+                    "Interview Category", list(QUESTION_CATEGORIES.keys())
+                ),
+                "difficulty": st.selectbox(
+                    "Difficulty Level", list(DIFFICULTY_LEVELS.keys()), index=1
+                ),
+                # Timer control
+                "auto_refresh": st.checkbox("Live Timer Updates", value=True),
+            }
+            for key, value in new_settings.items():
+                if st.session_state[key] != value:
+                    st.session_state[key] = value
+                    settings_changed = True
+
+        # AI Query Section
+        st.markdown("---")
+        st.subheader("🤖 Ask AI Coach")
+        user_query = st.text_input("Quick question:", placeholder="How to answer behavioral questions?")
+
+        if user_query and st.button("Ask", type="secondary"):
+            with st.expander("💡 AI Answer", expanded=True):
+                st.write_stream(ask_chat_stream(
+                    f"As an interview coach, answer this question concisely: {user_query}",
+                    max_tokens=600
+                ))
+
+        if settings_changed:
+            st.rerun(scope="app")
+
+render_sidebar()
 
 # Main Content Area
 if st.session_state.mode == "Practice Questions & Answers":
@@ -766,15 +1410,23 @@ if st.session_state.mode == "Practice Questions & Answers":
             Make answers specific, actionable, and include examples where appropriate.
             """
             
-            with st.spinner(f"🎯 Generating {num_qa} questions about {topic}..."):
-                generated_content = ask_chat(prompt)
-            
-            st.success(f"✅ Generated practice material for {topic}")
-            
             with st.container():
                 st.markdown("### 📋 Practice Material")
-                st.markdown(generated_content)
-                
+                # Same disk tier ask_chat_cached uses: regenerating an
+                # identical (topic, count, level) config renders instantly
+                # instead of re-streaming the same material from OpenAI
+                cache_key = hashlib.sha256(f"gpt-4o-mini\n{prompt}".encode()).hexdigest()
+                generated_content = _disk_cache_get(cache_key)
+                if generated_content is not None:
+                    st.markdown(generated_content)
+                else:
+                    generated_content = st.write_stream(ask_chat_stream(prompt))
+                    if isinstance(generated_content, str) and not generated_content.startswith("❌"):
+                        _disk_cache_set(cache_key, prompt, generated_content, "gpt-4o-mini")
+
+            st.success(f"✅ Generated practice material for {topic}")
+
+            with st.container():
                 # Download option
                 st.download_button(
                     "📥 Download as Text File",
@@ -785,60 +1437,37 @@ if st.session_state.mode == "Practice Questions & Answers":
 
 elif st.session_state.mode == "Interview Analytics":
     st.header("📊 Interview Performance Analytics")
-    
-    if st.session_state.answers:
+
+    answers = _load_answers()
+    if answers:
+        collect_scores()
+        answers = _load_answers()
+
         # Calculate overall statistics
-        total_questions = len(st.session_state.answers)
-        answered_questions = sum(1 for a in st.session_state.answers if a.get('answer', '').strip())
-        avg_time = sum(a.get('time_taken', 0) for a in st.session_state.answers) / total_questions
+        total_questions = len(answers)
+        answered_questions = sum(a.answered for a in answers)
+        avg_time = sum(a.time_taken for a in answers) / total_questions
         
         # Mobile-optimized metrics
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card fade-in-up">
-                <div class="metric-value">{answered_questions}/{total_questions}</div>
-                <div class="metric-label">Questions Completed</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class="metric-card fade-in-up">
-                <div class="metric-value">{avg_time:.1f}s</div>
-                <div class="metric-label">Avg Time</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card fade-in-up">
-                <div class="metric-value">{(answered_questions/total_questions)*100:.1f}%</div>
-                <div class="metric-label">Completion Rate</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class="metric-card fade-in-up">
-                <div class="metric-value">{st.session_state.category}</div>
-                <div class="metric-label">Category</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(metrics_html((
+            (f"{answered_questions}/{total_questions}", "Questions Completed"),
+            (f"{(answered_questions/total_questions)*100:.1f}%", "Completion Rate"),
+            (f"{avg_time:.1f}s", "Avg Time"),
+            (st.session_state.category, "Category"),
+        )), unsafe_allow_html=True)
         
         # Detailed breakdown
         st.subheader("Question-by-Question Breakdown")
         
-        for i, answer_data in enumerate(st.session_state.answers):
+        for i in range(len(answers)):
+            answer_data = get_answer_view(i, answers)
             with st.expander(f"Q{i+1}: {answer_data['question'][:50]}...", expanded=False):
-                st.write(f"**Your Answer:** {answer_data.get('answer', 'No answer provided')}")
-                st.write(f"**Time Taken:** {answer_data.get('time_taken', 0)}s")
+                st.write(f"**Your Answer:** {answer_data['answer'] or 'No answer provided'}")
+                st.write(f"**Time Taken:** {answer_data['time_taken']}s")
                 
-                time_limit = st.session_state.time_limit
-                if answer_data.get('time_taken', 0) <= time_limit * 0.5:
-                    st.success("⚡ Quick response")
-                elif answer_data.get('time_taken', 0) <= time_limit:
-                    st.info("⏱️ Good timing")
-                else:
-                    st.warning("🐌 Over time limit")
+                alert, msg = _TIMING_ALERTS[
+                    _timing_idx(answer_data['time_taken'], st.session_state.time_limit)]
+                alert(msg)
     else:
         st.info("📈 Complete an interview first to see your analytics!")
 
@@ -874,10 +1503,10 @@ else:  # Start Mock Interview Mode
         
         if st.button("🚀 Start Interview", type="primary"):
             # Select questions based on category and difficulty
-            available_questions = QUESTION_CATEGORIES[st.session_state.category].copy()
-            random.shuffle(available_questions)
-            
-            selected_questions = available_questions[:st.session_state.num_questions]
+            question_pool = QUESTION_CATEGORIES[st.session_state.category]
+            selected_questions = random.sample(
+                question_pool, min(st.session_state.num_questions, len(question_pool))
+            )
             
             # Adjust time based on difficulty
             time_multiplier = DIFFICULTY_LEVELS[st.session_state.difficulty]["time_multiplier"]
@@ -886,12 +1515,13 @@ else:  # Start Mock Interview Mode
             # Initialize interview state
             st.session_state.questions = selected_questions
             st.session_state.current_q = 0
-            st.session_state.answers = []
+            st.session_state.answers_blob = b"[]"
             st.session_state.candidate_name = None
-            st.session_state.start_time = time.time()
+            st.session_state.start_time = _time()
             st.session_state.feedback = None
             st.session_state.time_limit = adjusted_time
             st.session_state.paused = False
+            st.session_state.score_futures = {}
             
             st.rerun()
     
@@ -899,7 +1529,14 @@ else:  # Start Mock Interview Mode
     elif st.session_state.current_q < len(st.session_state.questions):
         q_index = st.session_state.current_q
         current_question = st.session_state.questions[q_index]
-        
+
+
+        # Pick up the candidate's name once background first-answer scoring lands
+        first_future = st.session_state.score_futures.get(0)
+        if (st.session_state.candidate_name is None and first_future is not None
+                and first_future.done()):
+            collect_scores(timeout=0)
+
         # Display question with candidate name if available
         display_question = current_question
         if st.session_state.candidate_name and q_index > 0:
@@ -918,55 +1555,11 @@ else:  # Start Mock Interview Mode
         </div>
         ''', unsafe_allow_html=True)
         
-        # Timer logic with continuous updates
-        if st.session_state.start_time and not st.session_state.paused:
-            elapsed = int(time.time() - st.session_state.start_time)
-            remaining = max(0, st.session_state.time_limit - elapsed)
-            
-            # Timer display with enhanced styling
-            if remaining > 30:
-                timer_class = "timer-normal"
-                timer_emoji = "🟢"
-            elif remaining > 10:
-                timer_class = "timer-warning"
-                timer_emoji = "🟡"
-            else:
-                timer_class = "timer-danger"
-                timer_emoji = "🔴"
-            
-            st.markdown(f'''
-            <div class="timer-container {timer_class} fade-in-up">
-                <div style="font-size: 1.5rem; font-weight: bold;">
-                    {timer_emoji} Time Remaining: {format_time(remaining)}
-                </div>
-            </div>
-            ''', unsafe_allow_html=True)
-            
-            # Auto-advance when time runs out
-            if remaining == 0:
-                st.warning("⏰ Time's up! Moving to next question...")
-                
-                # Get current answer from text area
-                current_answer = st.session_state.get(f"answer_{q_index}_{st.session_state.difficulty}", "")
-                
-                st.session_state.answers.append({
-                    "question": current_question,
-                    "display_question": display_question,
-                    "answer": current_answer,
-                    "time_taken": st.session_state.time_limit,
-                    "category": st.session_state.category,
-                    "difficulty": st.session_state.difficulty
-                })
-                
-                # Extract name from first answer
-                if q_index == 0 and current_answer.strip():
-                    st.session_state.candidate_name = extract_name(current_answer)
-                
-                st.session_state.current_q += 1
-                st.session_state.start_time = time.time()
-                time.sleep(1)  # Brief pause
-                st.rerun()
-        
+        # Live timer: re-runs as a 1 Hz fragment when updates are enabled,
+        # otherwise only on user actions
+        run_every = "1s" if (st.session_state.auto_refresh and not st.session_state.paused) else None
+        st.fragment(run_every=run_every)(render_timer)()
+
         # Question display with enhanced visibility
         st.markdown(f'''
         <div class="question-card fade-in-up">
@@ -989,22 +1582,18 @@ else:  # Start Mock Interview Mode
         with col1:
             if st.button("✅ Submit Answer", type="primary", use_container_width=True):
                 # Save answer
-                st.session_state.answers.append({
-                    "question": current_question,
-                    "display_question": display_question,
-                    "answer": user_answer,
-                    "time_taken": int(time.time() - st.session_state.start_time) if st.session_state.start_time else 0,
-                    "category": st.session_state.category,
-                    "difficulty": st.session_state.difficulty
-                })
-                
-                # Extract name from first answer
-                if q_index == 0 and user_answer.strip():
-                    st.session_state.candidate_name = extract_name(user_answer)
+                _append_answer(AnswerRecord(
+                    q_idx=q_index,
+                    answer=user_answer,
+                    time_taken=int(_time() - st.session_state.start_time) if st.session_state.start_time else 0
+                ))
                 
+                # Score in the background; the next question renders immediately
+                queue_scoring(q_index, user_answer, current_question)
+
                 # Move to next question
                 st.session_state.current_q += 1
-                st.session_state.start_time = time.time()
+                st.session_state.start_time = _time()
                 st.rerun()
         
         with col2:
@@ -1016,145 +1605,79 @@ else:  # Start Mock Interview Mode
         
         # Skip button (full width on mobile)
         if st.button("⏭️ Skip Question", use_container_width=True, help="Skip this question and move to the next one"):
-            st.session_state.answers.append({
-                "question": current_question,
-                "display_question": display_question,
-                "answer": "",
-                "time_taken": int(time.time() - st.session_state.start_time) if st.session_state.start_time else 0,
-                "category": st.session_state.category,
-                "difficulty": st.session_state.difficulty
-            })
+            _append_answer(AnswerRecord(
+                q_idx=q_index,
+                answer="",
+                time_taken=int(_time() - st.session_state.start_time) if st.session_state.start_time else 0
+            ))
             
             st.session_state.current_q += 1
-            st.session_state.start_time = time.time()
+            st.session_state.start_time = _time()
             st.rerun()
     
     # Interview completed - Results and Feedback
-    elif st.session_state.current_q >= len(st.session_state.questions) and st.session_state.answers:
+    elif st.session_state.current_q >= len(st.session_state.questions) and (answers := _load_answers()):
         st.balloons()
         st.success("🎉 Congratulations! Interview Completed Successfully!")
-        
-        # Summary statistics with mobile-friendly layout
-        total_time = sum(a.get('time_taken', 0) for a in st.session_state.answers)
-        answered_count = sum(1 for a in st.session_state.answers if a.get('answer', '').strip())
+
+        # Gather any scorings still running in the background
+        collect_scores()
+        answers = _load_answers()
+
+        # Joined views used by everything below (metrics, feedback, report)
+        answer_views = [get_answer_view(i, answers) for i in range(len(answers))]
+
+        # Summary statistics with mobile-friendly layout, computed once and
+        # reused by the metric cards, feedback prompt, and download reports
+        total_q = len(answers)
+        total_time = sum(a.time_taken for a in answers)
+        answered_count = sum(a.answered for a in answers)
+        completion_pct = answered_count * 100.0 / total_q
+
+        # Score whatever slipped past the background pool and generate the
+        # feedback report in one concurrent batch — both only happen on the
+        # first pass, after which session state and the blob carry them
+        unscored = [(i, answer_views[i]) for i, a in enumerate(answers)
+                    if a.answered and a.evaluation is None]
+        if unscored or not st.session_state.feedback:
+            with st.spinner("🎯 Scoring answers and generating AI feedback..."):
+                feedback_prompt = None if st.session_state.feedback else \
+                    build_feedback_prompt(answer_views, answered_count, total_time)
+                evaluations, raw_feedback = finalize_results(unscored, feedback_prompt)
+                if evaluations:
+                    for q_idx, evaluation in evaluations.items():
+                        answers[q_idx].evaluation = evaluation
+                    _save_answers(answers)
+                    answer_views = [get_answer_view(i, answers) for i in range(len(answers))]
+                if raw_feedback is not None:
+                    try:
+                        st.session_state.feedback = _loads(raw_feedback)
+                    except ValueError:
+                        st.session_state.feedback = raw_feedback
         
         # Mobile-optimized metrics display
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card fade-in-up">
-                <div class="metric-value">{len(st.session_state.answers)}</div>
-                <div class="metric-label">Total Questions</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class="metric-card fade-in-up">
-                <div class="metric-value">{format_time(total_time)}</div>
-                <div class="metric-label">Total Time</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card fade-in-up">
-                <div class="metric-value">{answered_count}</div>
-                <div class="metric-label">Questions Answered</div>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown(f"""
-            <div class="metric-card fade-in-up">
-                <div class="metric-value">{(answered_count/len(st.session_state.answers))*100:.0f}%</div>
-                <div class="metric-label">Completion Rate</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(metrics_html((
+            (total_q, "Total Questions"),
+            (answered_count, "Questions Answered"),
+            (format_time(total_time), "Total Time"),
+            (f"{completion_pct:.0f}%", "Completion Rate"),
+        )), unsafe_allow_html=True)
         
         # Detailed Results
         st.subheader("📋 Your Interview Responses")
         
-        for i, answer_data in enumerate(st.session_state.answers):
+        rows_html = [render_result_row(v, st.session_state.time_limit) for v in answer_views]
+        for i, answer_data in enumerate(answer_views):
             with st.expander(f"Q{i+1}: {answer_data['question']}", expanded=False):
-                if answer_data.get('answer', '').strip():
-                    st.markdown(f"**Your Answer:**")
-                    st.write(answer_data['answer'])
-                else:
-                    st.markdown("*No answer provided*")
-                
-                # Performance indicators with mobile-friendly styling
-                time_taken = answer_data.get('time_taken', 0)
-                st.markdown(f"**Time Taken:** {time_taken}s")
-                
-                time_ratio = time_taken / st.session_state.time_limit
-                if time_ratio <= 0.5:
-                    st.success("⚡ Quick Response - Great timing!")
-                elif time_ratio <= 0.8:
-                    st.info("✅ Good Timing - Well paced")
-                elif time_ratio <= 1.0:
-                    st.warning("⏱️ Close Call - Used most of the time")
-                else:
-                    st.error("⏰ Over Time - Consider being more concise")
-        
-        # Generate AI Feedback
-        if not st.session_state.feedback:
-            with st.spinner("🎯 Generating detailed AI feedback and scores..."):
-                feedback_prompt = f"""
-                As an expert interview coach, analyze this {st.session_state.difficulty}-level {st.session_state.category} interview performance.
-                
-                Candidate: {st.session_state.candidate_name or 'Anonymous'}
-                Difficulty: {st.session_state.difficulty}
-                Category: {st.session_state.category}
-                
-                Interview Performance Summary:
-                - Total Questions: {len(st.session_state.answers)}
-                - Questions Answered: {answered_count}
-                - Total Time: {format_time(total_time)}
-                - Completion Rate: {(answered_count/len(st.session_state.answers))*100:.1f}%
-                
-                Questions and Answers:
-                """
-                
-                for idx, ans in enumerate(st.session_state.answers, 1):
-                    feedback_prompt += f"""
-                    
-                Q{idx}: {ans['question']}
-                Answer: {ans.get('answer', '[No answer provided]')[:500]}...
-                Time Used: {ans.get('time_taken', 0)}s / {st.session_state.time_limit}s
-                """
-                
-                feedback_prompt += f"""
-                
-                Please provide comprehensive feedback including:
-                
-                1. **Overall Performance Score (0-100):**
-                
-                2. **Strengths Demonstrated:**
-                   - List 3-4 key strengths observed
-                
-                3. **Areas for Improvement:**
-                   - List 3-4 specific areas to work on
-                
-                4. **Question-by-Question Analysis:**
-                   - Brief feedback on each answer (1-2 sentences each)
-                
-                5. **Recommendations for Next Steps:**
-                   - Specific actionable advice for improvement
-                
-                6. **Interview Readiness Assessment:**
-                   - Overall readiness level and what to focus on
-                
-                Format the response with clear headers and bullet points for mobile readability.
-                """
-                
-                st.session_state.feedback = ask_chat(feedback_prompt)
+                st.markdown(rows_html[i], unsafe_allow_html=True)
         
         # Display Feedback with mobile-optimized styling
         st.subheader("🎯 AI Coach Feedback & Analysis")
-        
-        if "❌" not in str(st.session_state.feedback):
+
+        if isinstance(st.session_state.feedback, dict) or "❌" not in str(st.session_state.feedback):
             # Create expandable sections for better mobile experience
             with st.expander("📊 Complete Feedback Report", expanded=True):
-                st.markdown(st.session_state.feedback)
+                st.markdown(feedback_to_markdown(st.session_state.feedback))
         else:
             st.error("Unable to generate feedback at this time. Please check your OpenAI connection.")
         
@@ -1166,13 +1689,17 @@ else:  # Start Mock Interview Mode
         with col1:
             if st.button("🔄 New Interview", type="primary", use_container_width=True):
                 # Reset interview state
-                keys_to_reset = ["current_q", "questions", "answers", "candidate_name", 
-                               "start_time", "feedback", "paused"]
+                keys_to_reset = ["current_q", "questions", "answers_blob", "candidate_name",
+                               "start_time", "feedback", "paused", "score_futures"]
                 for key in keys_to_reset:
                     if key in ["current_q", "candidate_name", "start_time", "feedback"]:
                         st.session_state[key] = None
                     elif key == "paused":
                         st.session_state[key] = False
+                    elif key == "score_futures":
+                        st.session_state[key] = {}
+                    elif key == "answers_blob":
+                        st.session_state[key] = b"[]"
                     else:
                         st.session_state[key] = []
                 st.rerun()
@@ -1190,85 +1717,38 @@ else:  # Start Mock Interview Mode
         # Download results section
         st.markdown("---")
         st.subheader("📥 Download Your Results")
-        
-        # Prepare results for download
-        results_text = f"""
-AI MOCK INTERVIEW RESULTS
-========================
-Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Candidate: {st.session_state.candidate_name or 'Anonymous'}
-Category: {st.session_state.category}
-Difficulty: {st.session_state.difficulty}
-Total Questions: {len(st.session_state.answers)}
-Questions Answered: {answered_count}
-Completion Rate: {(answered_count/len(st.session_state.answers))*100:.0f}%
-Total Time: {format_time(total_time)}
-
-QUESTIONS & ANSWERS
-==================
-"""
-        
-        for i, ans in enumerate(st.session_state.answers, 1):
-            results_text += f"""
-Q{i}: {ans['question']}
-Time Allocated: {st.session_state.time_limit}s
-Time Used: {ans.get('time_taken', 0)}s
-
-Your Answer:
-{ans.get('answer', '[No answer provided]')}
-
-{'='*50}
-"""
-        
-        results_text += f"""
 
-AI COACH FEEDBACK
-================
-{st.session_state.feedback or 'Feedback not available - please check your OpenAI connection'}
+        feedback_md = (feedback_to_markdown(st.session_state.feedback)
+                       if st.session_state.feedback
+                       else 'Feedback not available - please check your OpenAI connection')
+        results_text, summary_text = build_report(
+            st.session_state.answers_blob, tuple(st.session_state.questions),
+            st.session_state.candidate_name, st.session_state.category,
+            st.session_state.difficulty, feedback_md, st.session_state.time_limit
+        )
+        # One clock read for both file names, so they always carry the
+        # same stamp even across a minute boundary
+        file_stamp = _dt.now().strftime('%Y%m%d_%H%M')
 
-END OF REPORT
-=============
-Generated by AI Mock Interview Bot
-"""
-        
         st.download_button(
             "📄 Download Complete Report",
             data=results_text,
-            file_name=f"interview_results_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+            file_name=f"interview_results_{file_stamp}.txt",
             mime="text/plain",
             use_container_width=True,
             help="Download your complete interview results and feedback"
         )
         
-        # Performance summary for quick sharing
-        summary_text = f"""
-🎯 INTERVIEW SUMMARY
-Completed {answered_count}/{len(st.session_state.answers)} questions
-Category: {st.session_state.category} ({st.session_state.difficulty})
-Time: {format_time(total_time)}
-Completion: {(answered_count/len(st.session_state.answers))*100:.0f}%
-
-Ready for your next challenge! 🚀
-"""
-        
         st.download_button(
             "📱 Download Summary",
             data=summary_text,
-            file_name=f"interview_summary_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+            file_name=f"interview_summary_{file_stamp}.txt",
             mime="text/plain",
             use_container_width=True,
             help="Download a quick summary for sharing"
         )
 
 # Footer
-st.markdown('''
-<div class="footer fade-in-up">
-    <h4>🚀 AI Mock Interview Bot</h4>
-    <p><strong>Practice makes perfect!</strong></p>
-    <p>💡 <em>Pro Tip: Regular practice with different difficulty levels will boost your confidence</em></p>
-    <p>📱 <em>Optimized for mobile - practice anywhere, anytime!</em></p>
-    <p>🎯 <em>Enhanced with perfect alignment and beautiful animations!</em></p>
-</div>
-''', unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 # streamlit run app.py
\ No newline at end of file
@@ -1,15 +1,21 @@
 # prompts.py
+#
+# Prompt builders are plain functions returning f-strings: interpolation
+# happens as one BUILD_STRING at call time instead of re-running the
+# str.format mini-language over the template on every call.
 
-# System prompt template for generating interview questions
-QUESTION_PROMPT = """
+# System prompt for generating interview questions
+def question_prompt(role, num):
+    return f"""
 You are an expert interviewer specializing in {role} positions.
 Generate {num} interview questions that are clear, concise, and relevant to the role.
 Do not provide answers—only the questions.
 Number each question sequentially.
 """
 
-# System prompt template for evaluating interview answers
-EVALUATION_PROMPT = """
+# System prompt for evaluating interview answers
+def evaluation_prompt(question, answer):
+    return f"""
 You are a professional interview evaluator.
 Given the following question and candidate answer, provide a score from 1 to 10,
 and explain your reasoning briefly.
@@ -26,7 +32,8 @@ Reason: <Your reasoning>
 """
 
 # Prompt for detecting candidate's name from "Tell me about yourself" or any introduction
-NAME_DETECTION_PROMPT = """
+def name_detection_prompt(text):
+    return f"""
 Extract the candidate's first name from the following introduction text.
 If no name is mentioned, respond with "Unknown".
 
@@ -35,7 +42,8 @@ Introduction:
 """
 
 # Prompt for suggesting improvements to the user's answer after interview
-IMPROVEMENT_PROMPT = """
+def improvement_prompt(question, answer):
+    return f"""
 You are a professional career coach and interview mentor.
 Given the question and candidate's answer, suggest specific improvements that will make the answer stronger.
 
@@ -52,7 +60,8 @@ Format the output as:
 """
 
 # Prompt for searching question answers
-SEARCH_ANSWER_PROMPT = """
+def search_answer_prompt(question):
+    return f"""
 You are an expert interviewer and answer provider.
 Provide a short, well-structured model answer for the following interview question:
 